@@ -1,10 +1,22 @@
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    TranscriptsDisabled,
+    NoTranscriptFound,
+    NoTranscriptAvailable,
+    VideoUnavailable,
+    InvalidVideoId,
+)
+# Not re-exported by the package; used so transcript fetches share _SESSION.
+from youtube_transcript_api._transcripts import TranscriptListFetcher
 import streamlit as st
 import google.generativeai as genai
 import re
-import json
+import orjson
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv  
 
 load_dotenv()
@@ -19,101 +31,67 @@ if not youtube_api_key:
     st.error("❌ YouTube API key missing! Set YOUTUBE_API_KEY in environment variables.")
     st.stop()
 
-genai.configure(api_key=api_key)
-model = genai.GenerativeModel("gemini-1.5-flash")
+@st.cache_resource
+def get_model():
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel("gemini-1.5-flash")
 
-TRANSCRIPT_DIR = "cached_transcripts"
-os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
-
-def extract_video_id(url):
-    pattern = r"(?:v=|\/)([0-9A-Za-z_-]{11})"
-    match = re.search(pattern, url)
-    return match.group(1) if match else None
-
-def format_time(seconds):
-    try:
-        seconds = float(seconds)
-        
-        hours = int(seconds) // 3600
-        minutes = (int(seconds) % 3600) // 60
-        secs = int(seconds) % 60
-        
-        if hours > 0:
-            return f"{hours:01}:{minutes:02}:{secs:02}"
-        else:
-            return f"{minutes:02}:{secs:02}"
-    except (ValueError, TypeError):
-        return "N/A"
+model = get_model()
 
-def get_video_details(video_id):
-    url = f"https://www.googleapis.com/youtube/v3/videos?part=snippet&id={video_id}&key={youtube_api_key}"
-    response = requests.get(url)
-
-    if response.status_code == 200:
-        data = response.json()
-        if "items" in data and len(data["items"]) > 0:
-            snippet = data["items"][0]["snippet"]
-            return snippet["title"], snippet["channelTitle"]
-    return "Unknown Title", "Unknown Channel"
-
-def save_transcript(video_id, transcript):
-    file_path = os.path.join(TRANSCRIPT_DIR, f"{video_id}.json")
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(transcript, f, ensure_ascii=False, indent=2)
-
-def load_transcript(video_id):
-    file_path = os.path.join(TRANSCRIPT_DIR, f"{video_id}.json")
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return None
-
-def get_transcript(video_id):
-    cached_transcript = load_transcript(video_id)
-    if cached_transcript:
-        return cached_transcript, None
-
-    try:
-        transcript_data = YouTubeTranscriptApi.get_transcript(video_id)
-        transcript = [{"start": entry["start"], "text": entry["text"]} for entry in transcript_data]
-        save_transcript(video_id, transcript) 
-        return transcript, None
-    except Exception as e:
-        return None, f"Error: {str(e)}"
-
-def analyze_ad_quality(transcript, video_id):
-    if not transcript:
-        st.error("⚠️ No transcript available for analysis.")
-        return None
-    if transcript:
-        last_entry = transcript[-1]
-        if 'start' in last_entry:
-            try:
-                last_timestamp = float(last_entry['start'])
-                video_length = last_timestamp + 5
-            except (ValueError, TypeError):
-                video_length = "unknown"
-        else:
-            video_length = "unknown"
-    else:
-        video_length = "unknown"
-
-    transcript_formatted = "\n".join(
-        f"[{format_time(entry['start'])}] {entry['text']}" for entry in transcript
-    )
+TRANSCRIPT_DIR = "cached_transcripts"
 
-    prompt = f"""
+YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
+
+@st.cache_resource
+def get_session():
+    # Shared across worker threads and reruns so lookups reuse pooled TCP/TLS connections.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return session
+
+_SESSION = get_session()
+
+ANALYSIS_DIR = os.path.join(TRANSCRIPT_DIR, "analysis")
+
+TRANSCRIPT_LANGUAGES = ("en",)
+
+# Failures that won't go away on retry; they are cached on disk for NEGATIVE_CACHE_TTL
+# seconds so repeated clicks don't re-hit YouTube. Anything else is retried next time.
+PERMANENT_TRANSCRIPT_ERRORS = (
+    NoTranscriptFound,
+    NoTranscriptAvailable,
+    InvalidVideoId,
+)
+NEGATIVE_CACHE_TTL = 86400
+# Raised whenever the watch page has no captions data, which includes the bot-check and
+# consent pages YouTube serves while rate-limiting, so they are only cached briefly.
+AMBIGUOUS_TRANSCRIPT_ERRORS = (
+    TranscriptsDisabled,
+    VideoUnavailable,
+)
+AMBIGUOUS_ERROR_CACHE_TTL = 900
+# Failed analyses may be transient (quota, network), so they expire much sooner.
+ERROR_CACHE_TTL = 300
+
+# Upper bound on videos per batched Gemini call, so the JSON array reply stays
+# well within the model's output-token limit.
+ANALYSIS_BATCH_SIZE = 6
+
+# Bump whenever the analysis prompt changes so stale cached responses are ignored.
+PROMPT_VERSION = "3"
+
+_PROMPT_HEAD = """
     You are an expert in analyzing YouTube ad integrations in videos of all lengths.
 
     **Video Info:**
     - Video ID: {video_id}
-    - Estimated video length: {format_time(video_length) if video_length != "unknown" else "unknown"}
+    - Estimated video length: {video_length}
     
     **Extract the Ad Segment and Evaluate its Quality**:
     - Carefully analyze the entire transcript to find where the creator is advertising a product or service.
     - Identify the **exact ad start & end timestamps** (in the format shown in the transcript).
     - Make sure your timestamps are accurate for this possibly hour-length video.
-    - Detect the **product name** being advertised.
+    - Detect the **product name** being advertised. If there is no ad, set "product_name" to "None".
     - Provide a **single Overall Ad Score (1-10)** with a **one-line explanation**.
     - Evaluate the ad using **five key metrics** with **scores (1-10) + short explanations**:
       1. **Ad Naturalness**
@@ -124,56 +102,410 @@ def analyze_ad_quality(transcript, video_id):
 
     **Transcript:**
     ```
-    {transcript_formatted}
+    """
+
+_PROMPT_TAIL = """
     ```
 
     **Output (JSON Format)**:
-    {{
+    {
       "product_name": "Detected Product",
       "start_time": "HH:MM:SS or MM:SS format matching transcript",
       "end_time": "HH:MM:SS or MM:SS format matching transcript",
       "overall_score": 0-10,
       "overall_summary": "One-line summary for overall score",
-      "ad_naturalness": {{"score": 0-10, "explanation": "1-2 line reason"}},
-      "persuasiveness": {{"score": 0-10, "explanation": "1-2 line reason"}},
-      "trustworthiness": {{"score": 0-10, "explanation": "1-2 line reason"}},
-      "ad_length_placement": {{"score": 0-10, "explanation": "1-2 line reason"}},
-      "engagement": {{"score": 0-10, "explanation": "1-2 line reason"}}
-    }}
+      "ad_naturalness": {"score": 0-10, "explanation": "1-2 line reason"},
+      "persuasiveness": {"score": 0-10, "explanation": "1-2 line reason"},
+      "trustworthiness": {"score": 0-10, "explanation": "1-2 line reason"},
+      "ad_length_placement": {"score": 0-10, "explanation": "1-2 line reason"},
+      "engagement": {"score": 0-10, "explanation": "1-2 line reason"}
+    }
     """
 
+_BATCH_PROMPT_HEAD = """
+    You are an expert in analyzing YouTube ad integrations in videos of all lengths.
+
+    You are given the transcripts of {count} videos. Analyze each video independently.
+
+    **For each video, Extract the Ad Segment and Evaluate its Quality**:
+    - Carefully analyze the entire transcript to find where the creator is advertising a product or service.
+    - Identify the **exact ad start & end timestamps** (in the format shown in the transcript).
+    - Make sure your timestamps are accurate for these possibly hour-length videos.
+    - Detect the **product name** being advertised. If there is no ad, set "product_name" to "None".
+    - Provide a **single Overall Ad Score (1-10)** with a **one-line explanation**.
+    - Evaluate the ad using **five key metrics** with **scores (1-10) + short explanations**:
+      1. **Ad Naturalness**
+      2. **Persuasiveness**
+      3. **Trustworthiness**
+      4. **Ad Length & Placement**
+      5. **Engagement**
+
+    **Transcripts:**
+"""
+
+_BATCH_PROMPT_TAIL = """
+
+    **Output (JSON Format)** - a JSON array with exactly one object per video:
+    [
+      {
+        "video_id": "Video ID from the section heading",
+        "product_name": "Detected Product",
+        "start_time": "HH:MM:SS or MM:SS format matching transcript",
+        "end_time": "HH:MM:SS or MM:SS format matching transcript",
+        "overall_score": 0-10,
+        "overall_summary": "One-line summary for overall score",
+        "ad_naturalness": {"score": 0-10, "explanation": "1-2 line reason"},
+        "persuasiveness": {"score": 0-10, "explanation": "1-2 line reason"},
+        "trustworthiness": {"score": 0-10, "explanation": "1-2 line reason"},
+        "ad_length_placement": {"score": 0-10, "explanation": "1-2 line reason"},
+        "engagement": {"score": 0-10, "explanation": "1-2 line reason"}
+      }
+    ]
+    """
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})")
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.DOTALL)
+
+def extract_video_id(url):
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+def _format_time_fast(total):
+    # Caller guarantees a non-negative int; used on the per-entry transcript path.
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02}:{secs:02}"
+    return f"{minutes:02}:{secs:02}"
+
+def format_time(seconds):
     try:
-        response = model.generate_content(prompt, generation_config={"temperature": 0})
-        clean_text = response.text.strip().strip("```json").strip("```").strip()
-        ad_data = json.loads(clean_text)
-        
-        return ad_data
-    except json.JSONDecodeError as e:
-        st.error(f"⚠️ JSON Parsing Error: {e} - LLM Response: {response.text}")
+        return _format_time_fast(int(float(seconds)))
+    except (ValueError, TypeError):
+        return "N/A"
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_video_details(video_id):
+    # Request errors and non-200 replies propagate so st.cache_data doesn't memoize them.
+    response = _SESSION.get(
+        YOUTUBE_VIDEOS_URL,
+        params={"part": "snippet", "id": video_id, "key": youtube_api_key},
+        timeout=5,
+    )
+    response.raise_for_status()
+
+    data = orjson.loads(response.content)
+    if "items" in data and len(data["items"]) > 0:
+        snippet = data["items"][0]["snippet"]
+        return snippet["title"], snippet["channelTitle"]
+    return "Unknown Title", "Unknown Channel"
+
+def get_video_details(video_id):
+    try:
+        return fetch_video_details(video_id)
+    except Exception:
+        return "Unknown Title", "Unknown Channel"
+
+def _path(video_id):
+    # Shard by the first two characters so no single directory grows unbounded.
+    return os.path.join(TRANSCRIPT_DIR, video_id[:2], f"{video_id}.json")
+
+def _analysis_path(key):
+    return os.path.join(ANALYSIS_DIR, key[:2], f"{key}.json")
+
+def save_transcript(video_id, transcript):
+    file_path = _path(video_id)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps(transcript))
+
+def load_transcript(video_id):
+    file_path = _path(video_id)
+    try:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
         return None
-    except Exception as e:
-        st.error(f"LLM Error: {e}")
+
+def analysis_key(prompt):
+    return hashlib.sha256(f"{PROMPT_VERSION}\n{prompt}".encode("utf-8")).hexdigest()
+
+def save_analysis(key, ad_data):
+    file_path = _analysis_path(key)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps(ad_data))
+
+def load_analysis(key):
+    file_path = _analysis_path(key)
+    try:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
         return None
 
-st.markdown("<h1 style='text-align: left;'>📊 YouTube Ad Quality Analyzer</h1>", unsafe_allow_html=True)
-st.write("Analyze YouTube ad segments for quality and effectiveness.")
+def is_no_ad(ad_data):
+    if not isinstance(ad_data, dict):
+        return True
+    return str(ad_data.get("product_name") or "").strip().lower() in ("", "none", "n/a", "null")
+
+def record_analysis(key, ad_data, error=None):
+    # Positive results never expire; "no ad" and error results are stored with
+    # a status and timestamp so lookup_analysis can expire them sooner.
+    if error:
+        save_analysis(key, {"status": "error", "error": error, "cached_at": time.time()})
+    elif is_no_ad(ad_data):
+        save_analysis(key, {"status": "no_ad", "ad_data": ad_data, "cached_at": time.time()})
+    else:
+        save_analysis(key, ad_data)
 
-video_urls = st.text_area("🔗 Enter YouTube Video Links (One per line)").split("\n")
+def lookup_analysis(key):
+    # Returns a cached (ad_data, error) pair, or None on a miss or expired entry.
+    cached_analysis = load_analysis(key)
+    if not cached_analysis:
+        return None
+    status = cached_analysis.get("status")
+    if status is None:
+        return cached_analysis, None
 
-if st.button("Analyze"):
-    valid_videos = [url.strip() for url in video_urls if url.strip()]
-    
-    if valid_videos:
-        for video_url in valid_videos:
-            video_id = extract_video_id(video_url)
-            if not video_id:
-                st.error(f"❌ Invalid YouTube URL: {video_url}")
-                continue           
-            
-            video_title, channel_name = get_video_details(video_id)
-
-            st.markdown(f"### 🎥 Video Title: {video_title}")
-            st.markdown(f"""
+    ttl = NEGATIVE_CACHE_TTL if status == "no_ad" else ERROR_CACHE_TTL
+    if time.time() - cached_analysis["cached_at"] >= ttl:
+        return None
+    if status == "no_ad":
+        return cached_analysis["ad_data"], None
+    return None, cached_analysis["error"]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_transcript(video_id):
+    # Transient errors propagate so st.cache_data doesn't memoize them.
+    cached_transcript = load_transcript(video_id)
+    if isinstance(cached_transcript, dict):
+        ambiguous = cached_transcript.get("ambiguous", False)
+        ttl = AMBIGUOUS_ERROR_CACHE_TTL if ambiguous else NEGATIVE_CACHE_TTL
+        if time.time() - cached_transcript["cached_at"] < ttl:
+            if ambiguous:
+                # Raised, not returned, so st.cache_data doesn't keep it past its TTL.
+                raise RuntimeError(cached_transcript["error"])
+            return None, f"Error: {cached_transcript['error']}"
+    elif cached_transcript:
+        # Older cache files predate the precomputed "ts" field; backfill them once.
+        if "ts" not in cached_transcript[0]:
+            for entry in cached_transcript:
+                entry["ts"] = _format_time_fast(int(entry["start"]))
+            save_transcript(video_id, cached_transcript)
+        return cached_transcript, None
+
+    try:
+        transcript_list = TranscriptListFetcher(_SESSION).fetch(video_id)
+        transcript_data = transcript_list.find_transcript(TRANSCRIPT_LANGUAGES).fetch()
+    except PERMANENT_TRANSCRIPT_ERRORS as e:
+        save_transcript(video_id, {"error": str(e), "cached_at": time.time()})
+        return None, f"Error: {str(e)}"
+    except AMBIGUOUS_TRANSCRIPT_ERRORS as e:
+        save_transcript(video_id, {"error": str(e), "ambiguous": True, "cached_at": time.time()})
+        raise
+
+    transcript = [
+        {"start": entry["start"], "text": entry["text"], "ts": _format_time_fast(int(entry["start"]))}
+        for entry in transcript_data
+    ]
+    save_transcript(video_id, transcript)
+    return transcript, None
+
+def get_transcript(video_id):
+    try:
+        return fetch_transcript(video_id)
+    except Exception as e:
+        return None, f"Error: {str(e)}"
+
+def estimate_video_length(transcript):
+    last_entry = transcript[-1]
+    if 'start' in last_entry:
+        try:
+            last_timestamp = float(last_entry['start'])
+            return format_time(last_timestamp + 5)
+        except (ValueError, TypeError):
+            return "unknown"
+    return "unknown"
+
+def densify(transcript, window=5.0):
+    # Merge consecutive caption lines into ~window-second chunks and drop empty
+    # ones; auto-captions emit a line every 1-2s, so this cuts prompt tokens.
+    merged = []
+    buffer = []
+    buffer_start = buffer_ts = None
+    for entry in transcript:
+        text = entry["text"].strip()
+        if not text:
+            continue
+        if buffer and entry["start"] - buffer_start >= window:
+            merged.append({"start": buffer_start, "text": " ".join(buffer), "ts": buffer_ts})
+            buffer = []
+        if not buffer:
+            buffer_start, buffer_ts = entry["start"], entry["ts"]
+        buffer.append(text)
+    if buffer:
+        merged.append({"start": buffer_start, "text": " ".join(buffer), "ts": buffer_ts})
+    return merged
+
+def format_transcript(transcript):
+    return "\n".join(
+        f"[{entry['ts']}] {entry['text']}" for entry in densify(transcript)
+    )
+
+def parse_llm_json(text):
+    clean_text = _FENCE_RE.sub("", text)
+    return orjson.loads(clean_text)
+
+def render_prompt(video_id, video_length, transcript_formatted):
+    head = _PROMPT_HEAD.format(video_id=video_id, video_length=video_length)
+    return "".join((head, transcript_formatted, _PROMPT_TAIL))
+
+def build_prompt(transcript, video_id):
+    return render_prompt(video_id, estimate_video_length(transcript), format_transcript(transcript))
+
+def render_batch_section(video_id, video_length, transcript_formatted):
+    return (
+        f"### Video {video_id}\n"
+        f"- Estimated video length: {video_length}\n"
+        f"```\n{transcript_formatted}\n```"
+    )
+
+def build_batch_prompt(sections):
+    head = _BATCH_PROMPT_HEAD.format(count=len(sections))
+    return "".join((head, "\n\n".join(sections), _BATCH_PROMPT_TAIL))
+
+def analyze_ad_quality(transcript, video_id):
+    if not transcript:
+        return None, "⚠️ No transcript available for analysis."
+
+    prompt = build_prompt(transcript, video_id)
+
+    key = analysis_key(prompt)
+    cached_result = lookup_analysis(key)
+    if cached_result:
+        return cached_result
+
+    return run_analysis(prompt, key)
+
+def run_analysis(prompt, key):
+    # Single-video Gemini call for an already-built prompt whose cache lookup missed.
+    ad_data = error = None
+    try:
+        response = model.generate_content(prompt, generation_config={"temperature": 0})
+        ad_data = parse_llm_json(response.text)
+        if not isinstance(ad_data, dict):
+            ad_data, error = None, f"⚠️ Expected a JSON object - LLM Response: {response.text}"
+    except orjson.JSONDecodeError as e:
+        error = f"⚠️ JSON Parsing Error: {e} - LLM Response: {response.text}"
+    except Exception as e:
+        error = f"LLM Error: {e}"
+
+    record_analysis(key, ad_data, error)
+    return ad_data, error
+
+def analyze_ad_quality_batch(transcripts):
+    # Returns {video_id: (ad_data, error)}. Cached videos are answered from disk;
+    # the remaining ones share one Gemini call per ANALYSIS_BATCH_SIZE videos.
+    results = {}
+    pending = {}
+    for video_id, transcript in transcripts:
+        if video_id in results or video_id in pending:
+            continue
+        if not transcript:
+            results[video_id] = (None, "⚠️ No transcript available for analysis.")
+            continue
+
+        # Format once: the same text feeds the cache key, the batch section and any fallback.
+        video_length = estimate_video_length(transcript)
+        transcript_formatted = format_transcript(transcript)
+        prompt = render_prompt(video_id, video_length, transcript_formatted)
+        key = analysis_key(prompt)
+        cached_result = lookup_analysis(key)
+        if cached_result:
+            results[video_id] = cached_result
+        else:
+            section = render_batch_section(video_id, video_length, transcript_formatted)
+            pending[video_id] = (prompt, key, section)
+
+    items = list(pending.items())
+    groups = [items[i:i + ANALYSIS_BATCH_SIZE] for i in range(0, len(items), ANALYSIS_BATCH_SIZE)]
+    if groups:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for group_results in executor.map(analyze_batch_group, groups):
+                results.update(group_results)
+
+    return results
+
+def analyze_batch_group(group):
+    # group is [(video_id, (prompt, key, section)), ...] of at most ANALYSIS_BATCH_SIZE videos.
+    if len(group) == 1:
+        video_id, (prompt, key, _) = group[0]
+        return {video_id: run_analysis(prompt, key)}
+
+    prompt = build_batch_prompt([section for _, (_, _, section) in group])
+    try:
+        response = model.generate_content(prompt, generation_config={"temperature": 0})
+    except Exception as e:
+        # Not recorded: the per-video keys belong to the single-video prompt,
+        # which never produced this error.
+        error = f"LLM Error: {e}"
+        return {video_id: (None, error) for video_id, _ in group}
+
+    try:
+        ad_list = parse_llm_json(response.text)
+    except Exception:
+        ad_list = None
+    by_id = {}
+    if isinstance(ad_list, list):
+        by_id = {item.get("video_id"): item for item in ad_list if isinstance(item, dict)}
+
+    results = {}
+    retries = []
+    for video_id, (single_prompt, key, _) in group:
+        ad_data = by_id.get(video_id)
+        if ad_data is None:
+            # Unparseable or incomplete batch reply: retry this video on its own.
+            retries.append((video_id, single_prompt, key))
+            continue
+        record_analysis(key, ad_data)
+        results[video_id] = (ad_data, None)
+
+    if retries:
+        with ThreadPoolExecutor(max_workers=len(retries)) as executor:
+            video_ids, prompts, keys = zip(*retries)
+            results.update(zip(video_ids, executor.map(run_analysis, prompts, keys)))
+
+    return results
+
+def process_video(video_url):
+    # Runs on a worker thread: network calls only, no Streamlit widget calls.
+    video_id = extract_video_id(video_url)
+    if not video_id:
+        return {"video_url": video_url, "video_id": None, "error": f"❌ Invalid YouTube URL: {video_url}"}
+
+    video_title, channel_name = get_video_details(video_id)
+    transcript, error = get_transcript(video_id)
+
+    return {
+        "video_url": video_url,
+        "video_id": video_id,
+        "video_title": video_title,
+        "channel_name": channel_name,
+        "transcript": transcript,
+        "analysis": None,
+        "error": error,
+    }
+
+def render_result(result):
+    video_url = result["video_url"]
+    video_id = result["video_id"]
+    if not video_id:
+        st.error(result["error"])
+        return
+
+    st.markdown(f"### 🎥 Video Title: {result['video_title']}")
+    st.markdown(f"""
     <style>
         .youtube-link a {{
             font-size: 20px !important;
@@ -192,38 +524,56 @@ if st.button("Analyze"):
     </div>
 """, unsafe_allow_html=True)
 
-            st.markdown(f"**📺 Channel Name:** {channel_name}")
+    st.markdown(f"**📺 Channel Name:** {result['channel_name']}")
+
+    if result["error"]:
+        st.error(result["error"])
+        return
 
-            with st.spinner("Fetching transcript..."):
-                transcript, error = get_transcript(video_id)
+    analysis = result["analysis"]
+    if not analysis:
+        return
 
-            if error:
-                st.error(error)
-                continue
+    st.markdown(f"### **📢 Ad Details**")
+    st.markdown(f"**🔹 Product Name:** {analysis['product_name']}")
+    st.markdown(f"**⏳ Ad Time Range:** {analysis['start_time']} - {analysis['end_time']}")
 
-            with st.spinner("Analyzing ad quality..."):
-                analysis = analyze_ad_quality(transcript, video_id)
+    st.markdown(f"### **⭐ Overall Ad Score: {analysis['overall_score']}/10**")
+    st.markdown(f"📌 {analysis['overall_summary']}")
 
-            if analysis:
-                st.markdown(f"### **📢 Ad Details**")
-                st.markdown(f"**🔹 Product Name:** {analysis['product_name']}")
-                st.markdown(f"**⏳ Ad Time Range:** {analysis['start_time']} - {analysis['end_time']}")
+    st.markdown("### **📊 Ad Quality Metrics:**")
+    metrics = [
+        ("Ad Naturalness", "ad_naturalness"),
+        ("Persuasiveness", "persuasiveness"),
+        ("Trustworthiness", "trustworthiness"),
+        ("Ad Length & Placement", "ad_length_placement"),
+        ("Engagement", "engagement"),
+    ]
+    for idx, (title, key) in enumerate(metrics, start=1):
+        st.markdown(f"**{idx}. {title}: {analysis[key]['score']}/10**")
+        st.markdown(f"   - {analysis[key]['explanation']}")
 
-                st.markdown(f"### **⭐ Overall Ad Score: {analysis['overall_score']}/10**")
-                st.markdown(f"📌 {analysis['overall_summary']}")
+    st.markdown("---")
+
+st.markdown("<h1 style='text-align: left;'>📊 YouTube Ad Quality Analyzer</h1>", unsafe_allow_html=True)
+st.write("Analyze YouTube ad segments for quality and effectiveness.")
+
+video_urls = st.text_area("🔗 Enter YouTube Video Links (One per line)").split("\n")
+
+if st.button("Analyze"):
+    valid_videos = [url.strip() for url in video_urls if url.strip()]
+    
+    if valid_videos:
+        with st.spinner("Fetching transcripts and analyzing ad quality..."):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(process_video, valid_videos))
 
-                st.markdown("### **📊 Ad Quality Metrics:**")
-                metrics = [
-                    ("Ad Naturalness", "ad_naturalness"),
-                    ("Persuasiveness", "persuasiveness"),
-                    ("Trustworthiness", "trustworthiness"),
-                    ("Ad Length & Placement", "ad_length_placement"),
-                    ("Engagement", "engagement"),
-                ]
-                for idx, (title, key) in enumerate(metrics, start=1):
-                    st.markdown(f"**{idx}. {title}: {analysis[key]['score']}/10**")
-                    st.markdown(f"   - {analysis[key]['explanation']}")
+            ready = [result for result in results if result["video_id"] and not result["error"]]
+            analyses = analyze_ad_quality_batch([(result["video_id"], result["transcript"]) for result in ready])
+            for result in ready:
+                result["analysis"], result["error"] = analyses[result["video_id"]]
 
-                st.markdown("---")
+        for result in results:
+            render_result(result)
     else:
         st.warning("Please enter at least one valid YouTube link.")